@@ -3,7 +3,9 @@ import sys
 import shutil
 import subprocess
 import json
-from typing import Dict
+import hashlib
+import importlib.metadata
+from typing import Dict, Optional
 
 def check_and_install_packages(packages_with_versions: Dict[str, str]):
     """检查并安装指定版本的包"""
@@ -155,6 +157,17 @@ def create_spec_file(sv_ttk_path: str):
         'win11toast'  # 总是包含win11toast，即使安装失败也不影响
     ]
     
+    # 程序中未使用的大型模块，排除后可缩短分析时间并减小exe体积
+    excludes = [
+        'numpy',
+        'pandas',
+        'matplotlib',
+        'IPython',
+        'pytest',
+        'pip',
+        'cryptography',
+    ]
+    
     # 创建spec文件内容
     spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 
@@ -172,7 +185,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    excludes={excludes},
     noarchive=False,
 )
 
@@ -284,6 +297,69 @@ except ImportError:
         print(f"修改chrome_manager.py失败: {str(e)}")
         print("继续打包过程...")
 
+def get_build_cache_dir() -> Optional[str]:
+    """根据打包输入计算缓存目录，输入未变化时可直接复用上次的打包结果"""
+    try:
+        # 安装步骤完成后重新读取实际安装的全部包（含间接依赖），而不是requirements.txt中的预设版本
+        distributions = sorted(
+            f"{dist.metadata['Name']}=={dist.version}" for dist in importlib.metadata.distributions()
+        )
+    except Exception as e:
+        print(f"获取已安装包信息时出错: {str(e)}，本次不使用打包缓存")
+        return None
+    
+    h = hashlib.sha256()
+    for filename in ['build.py', 'chrome_manager.py', 'chrome_manager.spec', 'app.ico', 'app.manifest', 'README.md', 'settings.json']:
+        h.update(filename.encode('utf-8'))
+        if os.path.exists(filename):
+            with open(filename, 'rb') as f:
+                h.update(f.read())
+    h.update(sys.version.encode('utf-8'))
+    for dist in distributions:
+        h.update(dist.encode('utf-8'))
+    
+    return os.path.join(os.path.expanduser('~'), '.cache', 'chrome-manager-build', h.hexdigest())
+
+def restore_build_cache(cache_dir: Optional[str]) -> bool:
+    """从缓存恢复dist目录，成功返回True"""
+    if not cache_dir or not os.path.isdir(cache_dir):
+        return False
+    try:
+        shutil.copytree(cache_dir, 'dist')
+        print(f"输入未变化，已从缓存恢复打包结果: {cache_dir}")
+        return True
+    except Exception as e:
+        print(f"从缓存恢复失败: {str(e)}，将重新打包")
+        if os.path.exists('dist'):
+            shutil.rmtree('dist')
+        return False
+
+def save_build_cache(cache_dir: Optional[str]):
+    """将dist目录保存到缓存"""
+    if not cache_dir or not os.path.exists('dist'):
+        return
+    # 先复制到临时目录，完整复制后再改名，避免留下不完整的缓存
+    temp_dir = cache_dir + '.tmp'
+    try:
+        if os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir)
+        shutil.copytree('dist', temp_dir)
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+        os.replace(temp_dir, cache_dir)
+        print(f"打包结果已缓存: {cache_dir}")
+    except Exception as e:
+        print(f"保存打包缓存失败: {str(e)}")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        return
+    
+    # 只保留最新的一份缓存，删除旧的打包结果
+    cache_root = os.path.dirname(cache_dir)
+    for name in os.listdir(cache_root):
+        old_dir = os.path.join(cache_root, name)
+        if old_dir != cache_dir and os.path.isdir(old_dir):
+            shutil.rmtree(old_dir, ignore_errors=True)
+
 def show_success_message():
     print("\n")
     print("─────────────────────────────────────────────────────")
@@ -371,6 +447,12 @@ def build():
     if os.path.exists('dist'):
         shutil.rmtree('dist')
     
+    # 输入未变化时直接复用缓存的打包结果
+    cache_dir = get_build_cache_dir()
+    if restore_build_cache(cache_dir):
+        show_success_message()
+        return True
+    
     # 运行PyInstaller
     print("\n正在打包程序...")
     try:
@@ -383,6 +465,8 @@ def build():
         if not os.path.exists(os.path.join('dist', 'settings.json')) and os.path.exists('settings.json'):
             shutil.copy('settings.json', os.path.join('dist', 'settings.json'))
         
+        save_build_cache(cache_dir)
+        
         show_success_message()
         return True
     except subprocess.CalledProcessError as e:
@@ -33,7 +33,6 @@ except ImportError:
 import re
 import socket
 import traceback
-import wmi
 import pythoncom  # 添加pythoncom导入
 import concurrent.futures
 import random
@@ -2182,6 +2181,8 @@ class ChromeManager:
                     
                     # 使用WMI搜索Chrome进程
                     def search_chrome_processes():
+                        # 仅在导入窗口时才用到wmi模块，延迟到这里导入，启动时少加载一个模块
+                        import wmi
                         c = wmi.WMI()
                         chrome_processes = []
                         # 不再更新进度文字